@@ -1,50 +1,56 @@
 from knowledge_framework import KnowledgeFramework
 from knowledge_framework.utils.helpers import analyze_code_structure
 import streamlit as st
+from functools import lru_cache
+import os
+
+APP_PATH = "app.py"
+
+# Improvement recommendations based on current implementation
+RECOMMENDATIONS = (
+    " UI Improvements:",
+    "- Add input validation with clear error messages for negative or zero values",
+    "- Include a visual diagram showing joint dimensions for clarity",
+    "- Add tooltips explaining each input field and its typical range",
+    "- Implement a dark/light mode toggle for better visibility",
+
+    "\n Calculation Features:",
+    "- Add a unit converter to switch between mm/cm/m",
+    "- Include preset joint profiles (V-joint, U-joint, etc.) with typical dimensions",
+    "- Add a safety factor selector for different application types",
+    "- Implement a coverage calculator for surface applications",
+
+    "\n Output Enhancements:",
+    "- Show cost estimation based on local sealant prices",
+    "- Compare different package types (sausage vs cartridge) efficiency",
+    "- Add a downloadable PDF summary of calculations",
+    "- Display historical calculation trends",
+
+    "\n Additional Features:",
+    "- Save calculations to local storage for future reference",
+    "- Add batch calculation mode for multiple joints",
+    "- Include manufacturer guidelines for common applications",
+    "- Provide a material waste reduction guide",
+    "- Add a temperature/climate consideration factor"
+)
 
 def analyze_calculator_app():
     """Analyze the calculator app and suggest improvements."""
+    # Results only change when app.py does, so cache on its modification time
+    return list(_analyze_calculator_app(os.path.getmtime(APP_PATH)))
+
+@lru_cache(maxsize=1)
+def _analyze_calculator_app(app_mtime: float):
+    """Analyze the calculator app as of the given modification time."""
     framework = KnowledgeFramework("knowledge_base")
     
     # Analyze app structure
-    try:
-        with open("app.py", "r", encoding='utf-8') as f:
-            app_code = f.read()
-    except UnicodeDecodeError:
-        with open("app.py", "r", encoding='latin-1') as f:
-            app_code = f.read()
+    with open(APP_PATH, "rb") as f:
+        app_code = f.read().decode("utf-8", "replace")
     
     analysis = analyze_code_structure(app_code)
     
-    # Generate recommendations based on current implementation
-    recommendations = [
-        " UI Improvements:",
-        "- Add input validation with clear error messages for negative or zero values",
-        "- Include a visual diagram showing joint dimensions for clarity",
-        "- Add tooltips explaining each input field and its typical range",
-        "- Implement a dark/light mode toggle for better visibility",
-        
-        "\n Calculation Features:",
-        "- Add a unit converter to switch between mm/cm/m",
-        "- Include preset joint profiles (V-joint, U-joint, etc.) with typical dimensions",
-        "- Add a safety factor selector for different application types",
-        "- Implement a coverage calculator for surface applications",
-        
-        "\n Output Enhancements:",
-        "- Show cost estimation based on local sealant prices",
-        "- Compare different package types (sausage vs cartridge) efficiency",
-        "- Add a downloadable PDF summary of calculations",
-        "- Display historical calculation trends",
-        
-        "\n Additional Features:",
-        "- Save calculations to local storage for future reference",
-        "- Add batch calculation mode for multiple joints",
-        "- Include manufacturer guidelines for common applications",
-        "- Provide a material waste reduction guide",
-        "- Add a temperature/climate consideration factor"
-    ]
-    
-    return recommendations
+    return RECOMMENDATIONS
 
 if __name__ == "__main__":
     recommendations = analyze_calculator_app()
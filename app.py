@@ -1,11 +1,8 @@
 import streamlit as st
-import pyshorteners
 from knowledge_integration import initialize_knowledge_system
-from utils.joint_profiles import JOINT_PROFILES, UnitConverter, JointValidator
-from utils.pdf_generator import generate_calculation_summary
-import os
-import tempfile
-from datetime import datetime
+from utils.joint_profiles import JOINT_PROFILES, PROFILE_OPTIONS, CM_TO_MM, M_TO_CM, JointValidator
+from utils.calculations import compute_sealant
+from utils.profile_guide import PROFILE_SPECS_MARKDOWN
 
 # Page configuration
 st.set_page_config(
@@ -17,8 +14,22 @@ st.set_page_config(
 # Initialize knowledge system
 knowledge = initialize_knowledge_system()
 
-# Custom CSS
-st.markdown("""
+@st.cache_data(max_entries=32, ttl=60, show_spinner=False)
+def build_summary_pdf(report_data: dict) -> bytes:
+    """Render the calculation summary PDF, reusing it for identical reports."""
+    # Report dependencies are only needed once a calculation is requested
+    import io
+    from utils.pdf_generator import generate_calculation_summary
+    
+    pdf_buffer = io.BytesIO()
+    generate_calculation_summary(report_data, pdf_buffer)
+    return pdf_buffer.getvalue()
+
+# Static page content
+UNIT_OPTIONS = ("mm", "cm")
+PACKAGE_TYPES = ("Sausage (600ml)", "Cartridge (300ml)")
+
+CUSTOM_CSS = """
     <style>
     .main {
         padding: 2rem;
@@ -32,7 +43,37 @@ st.markdown("""
         padding: 10px;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+INSTRUCTIONS_MD = """
+    ### How to Use
+    1. Select a joint profile or enter custom dimensions
+    2. Enter the joint measurements in your preferred units
+    3. Click calculate to see the required volume
+    4. Download a detailed PDF report of your calculations
+    
+    ### Formula Used
+    Volume (L) = Joint Width (cm) × Joint Depth (cm) × Joint Length (cm) ÷ 1000 × Profile Volume Factor
+    
+    The profile volume factor is 0.5 for V-Joints, whose triangular cross-section
+    holds half the sealant of a rectangular joint, and 1.0 for all other profiles.
+    
+    ### Tips
+    - Measure your gap carefully for accurate results
+    - Consider adding 15% extra for wastage
+    - Always check manufacturer recommendations for your specific application
+    """
+
+SHARE_MD = """
+    To share this calculator with others:
+    1. Deploy the app using Streamlit Sharing
+    2. Copy and share the generated URL
+    
+    Note: This is a local version. For sharing, deploy the app on Streamlit Cloud or a similar service.
+    """
+
+# Custom CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # Title and Introduction
 st.title("🔧 Silicone Sealant Calculator")
@@ -47,21 +88,7 @@ left_col, right_col = st.columns([2, 1])
 with left_col:
     # Instructions and formula explanation
     with st.expander("📖 Instructions and Formula Explanation", expanded=True):
-        st.markdown("""
-        ### How to Use
-        1. Select a joint profile or enter custom dimensions
-        2. Enter the joint measurements in your preferred units
-        3. Click calculate to see the required volume
-        4. Download a detailed PDF report of your calculations
-        
-        ### Formula Used
-        Volume (L) = Joint Width (cm) × Joint Depth (cm) × Joint Length (cm) ÷ 1000
-        
-        ### Tips
-        - Measure your gap carefully for accurate results
-        - Consider adding 15% extra for wastage
-        - Always check manufacturer recommendations for your specific application
-        """)
+        st.markdown(INSTRUCTIONS_MD)
 
     # Initialize session state for measurements
     if 'width' not in st.session_state:
@@ -73,12 +100,11 @@ with left_col:
     st.subheader("1. Select Joint Profile")
     profile_name = st.selectbox(
         "Choose a joint profile",
-        list(JOINT_PROFILES.keys()) + ["Custom"]
+        PROFILE_OPTIONS
     )
 
     # Unit selection for width and depth
-    unit_options = ["mm", "cm"]
-    selected_unit = st.selectbox("Width/Depth Unit:", unit_options, index=1)
+    selected_unit = st.selectbox("Width/Depth Unit:", UNIT_OPTIONS, index=1)
 
     # Use session state values if they exist, otherwise use defaults
     default_width = st.session_state.width if st.session_state.width is not None else (1.0 if selected_unit == "cm" else 10.0)
@@ -111,123 +137,45 @@ with left_col:
     with col4:
         package_type = st.selectbox(
             "Package Type",
-            ["Sausage (600ml)", "Cartridge (300ml)"],
+            PACKAGE_TYPES,
             help="Select the type of sealant package you plan to use"
         )
 
-    # Convert width and depth to cm for calculations
+    # Convert width and depth to cm for calculations and mm for validation
     if selected_unit == "mm":
-        width_cm = UnitConverter.mm_to_cm(width)
-        depth_cm = UnitConverter.mm_to_cm(depth)
+        width_mm, depth_mm = width, depth
+        width_cm, depth_cm = width / CM_TO_MM, depth / CM_TO_MM
     else:  # cm
-        width_cm = width
-        depth_cm = depth
+        width_cm, depth_cm = width, depth
+        width_mm, depth_mm = width * CM_TO_MM, depth * CM_TO_MM
 
     # Length is already in meters, convert to cm for volume calculation
-    length_cm = UnitConverter.m_to_cm(length)
+    length_cm = length * M_TO_CM
 
     # Add joint specification guide
     with st.expander("Joint Specifications Guide"):
-        # Get the current profile's specifications
-        profile_specs = JointValidator.get_profile_specs(profile_name)
-        
         # Display the specifications
         st.markdown(f"""
         ### {profile_name} Specifications
         """)
-        
-        # Profile-specific descriptions
-        profile_descriptions = {
-            "Square Joint": "Standard profile with width twice the depth (2:1 ratio), providing optimal balance between movement capability and material usage.",
-            "Deep Joint": "Deep profile with equal width and depth (1:1 ratio), ideal for joints with limited width but requiring good depth.",
-            "Wide Joint": "Wide profile with width twice the depth (2:1 ratio), suitable for larger gaps requiring multiple passes.",
-            "V-Joint": "V-shaped profile for corner applications (1.5:1 ratio), uses half the volume of a square joint due to triangular profile.",
-            "U-Joint": "U-shaped profile with enhanced movement capability (1.5:1 ratio), requires special tooling for proper formation."
-        }
-        
-        st.markdown(f"""
-        #### Profile Description
-        {profile_descriptions.get(profile_name, "Custom profile for specific requirements.")}
-        
-        #### Joint Dimension Guidelines
-        - **Width Range**: {profile_specs['min_width_mm']}mm - {profile_specs['max_width_mm']}mm
-        - **Depth Range**: {profile_specs['min_depth_mm']}mm - {profile_specs['max_depth_mm']}mm
-        - **Ideal Ratio**: Width:Depth = {profile_specs['width_to_depth_ratio']}:1
-        - **Tolerance**: ±{int(profile_specs['ratio_tolerance']*100)}% from ideal ratio
-        
-        #### Profile-Specific Considerations
-        1. **Typical Applications**:
-           - {"Most common profile type, ideal for general sealing applications" if profile_name == "Square Joint" else
-              "Requires backing rod, ideal for joints with limited width but requiring good depth" if profile_name == "Deep Joint" else
-              "Suitable for larger gaps, may require multiple application passes" if profile_name == "Wide Joint" else
-              "Ideal for corner applications, good for joints with angular movement" if profile_name == "V-Joint" else
-              "Suitable for expansion joints, excellent for accommodating multi-directional movement" if profile_name == "U-Joint" else
-              "Custom applications"}
-           
-        2. **Installation Notes**:
-           - {"Use backing rod if depth exceeds 10mm" if profile_name == "Square Joint" else
-              "Always use backing rod" if profile_name == "Deep Joint" else
-              "Depth should not exceed half the width for proper adhesion" if profile_name == "Wide Joint" else
-              "Tooling is critical for proper shape formation" if profile_name == "V-Joint" else
-              "Requires special tooling for U-shape formation" if profile_name == "U-Joint" else
-              "Follow manufacturer guidelines"}
-
-        3. **Volume Considerations**:
-           - {"Standard volume calculation" if profile_name == "Square Joint" else
-              "Standard volume calculation" if profile_name == "Deep Joint" else
-              "Consider multiple passes for large gaps" if profile_name == "Wide Joint" else
-              "Volume is approximately half of a square joint due to triangular profile" if profile_name == "V-Joint" else
-              "Additional material needed for curved profile" if profile_name == "U-Joint" else
-              "Calculate based on specific requirements"}
-        
-        #### Joint Ratio Examples
-        """)
-        
-        if profile_name == "Square Joint":
-            st.markdown("""
-            | Correct Ratio | Incorrect Ratio |
-            |---|---|
-            | 12mm wide x 6mm deep | 10mm wide x 10mm deep |
-            | 20mm wide x 10mm deep | 30mm wide x 10mm deep |
-            """)
-        elif profile_name == "Wide Joint":
-            st.markdown("""
-            | Correct Ratio | Incorrect Ratio |
-            |---|---|
-            | 30mm wide x 12mm deep | 30mm wide x 20mm deep |
-            | 40mm wide x 12mm deep | 50mm wide x 10mm deep |
-            """)
-        elif profile_name == "Deep Joint":
-            st.markdown("""
-            | Correct Ratio | Incorrect Ratio |
-            |---|---|
-            | 20mm wide x 20mm deep | 10mm wide x 20mm deep |
-            | 15mm wide x 18mm deep | 30mm wide x 40mm deep |
-            """)
-        elif profile_name == "V-Joint":
-            st.markdown("""
-            | Correct Ratio | Incorrect Ratio |
-            |---|---|
-            | 15mm wide x 10mm deep | 10mm wide x 10mm deep |
-            | 20mm wide x 12mm deep | 30mm wide x 10mm deep |
-            """)
-        elif profile_name == "U-Joint":
-            st.markdown("*Due to the complexity of U-shaped joints, specific dimension recommendations are highly application-specific.*")
-        else:
-            st.markdown("*Custom profile dimensions should be based on specific project requirements.*")
+        main_md, ratio_md = PROFILE_SPECS_MARKDOWN[profile_name]
+        st.markdown(main_md)
+        st.markdown(ratio_md)
         
         # Add visual separator
         st.markdown("---")
         
-    # Convert measurements for validation
-    width_mm = UnitConverter.cm_to_mm(width_cm) if selected_unit == "cm" else width
-    depth_mm = UnitConverter.cm_to_mm(depth_cm) if selected_unit == "cm" else depth
-    
-    # Get recommendations
-    recommendations = JointValidator.get_recommended_dimensions(width_mm=width_mm, depth_mm=depth_mm, profile_name=profile_name)
-    
-    # Validate dimensions with profile
-    validation = JointValidator.validate_dimensions(width_mm, depth_mm, profile_name, unit=selected_unit)
+    # Get recommendations and validate dimensions with profile, reusing the
+    # previous results when the measurements haven't changed since last rerun
+    validation_key = (width_mm, depth_mm, profile_name, selected_unit)
+    if st.session_state.get('validation_key') != validation_key:
+        st.session_state.validation_key = validation_key
+        st.session_state.recommendation_result = JointValidator.get_recommended_dimensions(
+            width_mm=width_mm, depth_mm=depth_mm, profile_name=profile_name)
+        st.session_state.validation_result = JointValidator.validate_dimensions(
+            width_mm, depth_mm, profile_name, unit=selected_unit)
+    recommendations = st.session_state.recommendation_result
+    validation = st.session_state.validation_result
     
     # Show recommendations before calculation
     if validation["recommendations"]:
@@ -243,8 +191,8 @@ with left_col:
     with rec_col1:
         if recommendations["recommended_width"] is not None:
             recommended_value = (
-                UnitConverter.mm_to_cm(recommendations["recommended_width"]) 
-                if selected_unit == "cm" 
+                recommendations["recommended_width"] / CM_TO_MM
+                if selected_unit == "cm"
                 else recommendations["recommended_width"]
             )
             if st.button(f"Use Recommended Width ({recommended_value:.1f} {selected_unit})"):
@@ -254,8 +202,8 @@ with left_col:
     with rec_col2:
         if recommendations["recommended_depth"] is not None:
             recommended_value = (
-                UnitConverter.mm_to_cm(recommendations["recommended_depth"]) 
-                if selected_unit == "cm" 
+                recommendations["recommended_depth"] / CM_TO_MM
+                if selected_unit == "cm"
                 else recommendations["recommended_depth"]
             )
             if st.button(f"Use Recommended Depth ({recommended_value:.1f} {selected_unit})"):
@@ -295,6 +243,12 @@ with right_col:
 
 # Calculation
 if st.button("Calculate Required Sealant"):
+    from datetime import datetime
+    
+    # Scale for the profile's cross-section; custom joints are rectangular
+    volume_factor = (JointValidator.get_profile_specs(profile_name).volume_factor
+                     if profile_name in JOINT_PROFILES else 1.0)
+    
     # Prepare input data
     inputs = {
         'width': width_cm,
@@ -303,25 +257,18 @@ if st.button("Calculate Required Sealant"):
         'package_type': package_type,
         'allow_wastage': allow_wastage,
         'unit': selected_unit,
-        'profile': profile_name
+        'profile': profile_name,
+        'volume_factor': volume_factor
     }
     
-    # Calculate base volume in litres
-    base_volume = (width_cm * depth_cm * length_cm) / 1000
-    
-    # Add wastage if enabled
-    volume = base_volume * 1.15 if allow_wastage else base_volume
-    
-    # Convert volume to ml for package calculations
-    volume_ml = volume * 1000
-    
     # Get package size based on selection
     package_size = 600 if package_type == "Sausage (600ml)" else 300
     package_name = "sausages" if package_type == "Sausage (600ml)" else "cartridges"
     
-    packages_needed = volume_ml / package_size
-    full_packages = int(packages_needed)
-    partial_package = packages_needed - full_packages
+    # Calculate volume in litres (with wastage if enabled) and packages required
+    (base_volume, volume, volume_ml,
+     packages_needed, full_packages, partial_package) = compute_sealant(
+        width_cm, depth_cm, length_cm, allow_wastage, package_size, volume_factor)
     
     # Prepare results data
     results = {
@@ -333,8 +280,8 @@ if st.button("Calculate Required Sealant"):
         'partial_package': partial_package
     }
     
-    # Log calculation to knowledge system
-    knowledge.log_calculation(inputs, results)
+    # Log calculation to knowledge system without blocking the results
+    knowledge.log_calculation_async(inputs, results)
     
     # Display results
     st.markdown("### Results")
@@ -356,15 +303,12 @@ if st.button("Calculate Required Sealant"):
         st.write(f"Total volume required: {volume:.3f} L ({volume * 1000:.1f} ml)")
     
     # Generate PDF report
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-        pdf_path = generate_calculation_summary({**inputs, **results}, tmp_file.name)
-        with open(pdf_path, 'rb') as pdf_file:
-            st.download_button(
-                label="Download Calculation Summary (PDF)",
-                data=pdf_file,
-                file_name=f"sealant_calculation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                mime="application/pdf"
-            )
+    st.download_button(
+        label="Download Calculation Summary (PDF)",
+        data=build_summary_pdf({**inputs, **results}),
+        file_name=f"sealant_calculation_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+        mime="application/pdf"
+    )
 
 # Display insights from knowledge system
 with st.expander("📊 Usage Insights", expanded=False):
@@ -377,10 +321,4 @@ with st.expander("📊 Usage Insights", expanded=False):
 
 # Share section
 with st.expander("🔗 Share this Calculator"):
-    st.markdown("""
-    To share this calculator with others:
-    1. Deploy the app using Streamlit Sharing
-    2. Copy and share the generated URL
-    
-    Note: This is a local version. For sharing, deploy the app on Streamlit Cloud or a similar service.
-    """)
+    st.markdown(SHARE_MD)
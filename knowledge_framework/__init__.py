@@ -1,6 +1,22 @@
-from .core.framework import KnowledgeFramework
-from .documentation.doc_manager import DocumentationManager
-from .learning.learner import KnowledgeLearner
+import importlib
 
 __version__ = '0.1.0'
 __all__ = ['KnowledgeFramework', 'DocumentationManager', 'KnowledgeLearner']
+
+# Public classes are imported on first access so that importing a submodule
+# doesn't pull in networkx and the rest of the framework's dependencies
+_LAZY_IMPORTS = {
+    'KnowledgeFramework': '.core.framework',
+    'DocumentationManager': '.documentation.doc_manager',
+    'KnowledgeLearner': '.learning.learner',
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
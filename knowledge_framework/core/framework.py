@@ -1,10 +1,10 @@
 from typing import Any, Dict, List, Optional
 import os
 import json
-import yaml
 import datetime
 import networkx as nx
 from pathlib import Path
+from ..utils.helpers import append_json_lines
 
 class KnowledgeFramework:
     def __init__(self, knowledge_base_path: str, llm: Any = None):
@@ -70,13 +70,21 @@ class KnowledgeFramework:
         Args:
             generation_data (Dict[str, Any]): Generation session data
         """
+        self.document_sessions([generation_data])
+    
+    def document_sessions(self, sessions: List[Dict[str, Any]]) -> None:
+        """Document several sessions with a single write to the session log.
+        
+        Args:
+            sessions (List[Dict[str, Any]]): Session data, in the order they occurred
+        """
         session_path = self.knowledge_base_path / 'sessions'
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        date = datetime.datetime.now().strftime('%Y%m%d')
         
-        with open(session_path / f'session_{timestamp}.yaml', 'w') as f:
-            yaml.dump(generation_data, f)
+        append_json_lines(session_path / f'sessions_{date}.jsonl', sessions)
         
-        self._update_knowledge_graph(generation_data)
+        for generation_data in sessions:
+            self._update_knowledge_graph(generation_data)
     
     def extract_knowledge(self) -> Dict[str, Any]:
         """Extract knowledge from accumulated sessions.
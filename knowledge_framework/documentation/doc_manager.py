@@ -1,8 +1,8 @@
 from typing import Dict, Any, List
 import os
 from pathlib import Path
-import yaml
 import datetime
+from ..utils.helpers import append_json_line
 
 class DocumentationManager:
     def __init__(self, base_path: str):
@@ -28,10 +28,10 @@ class DocumentationManager:
             generation_data (Dict[str, Any]): Data about the generation session
             
         Returns:
-            str: Path to the generated documentation
+            str: Path to the log file the documentation was appended to
         """
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        doc_path = self.docs_path / 'sessions' / f'session_{timestamp}.yaml'
+        date = datetime.datetime.now().strftime('%Y%m%d')
+        doc_path = self.docs_path / 'sessions' / f'sessions_{date}.jsonl'
         
         documentation = {
             'timestamp': datetime.datetime.now().isoformat(),
@@ -40,8 +40,7 @@ class DocumentationManager:
             'insights': self._extract_insights(generation_data)
         }
         
-        with open(doc_path, 'w') as f:
-            yaml.dump(documentation, f)
+        append_json_line(doc_path, documentation)
         
         return str(doc_path)
     
@@ -53,10 +52,10 @@ class DocumentationManager:
             metadata (Dict[str, Any]): Code metadata
             
         Returns:
-            str: Path to the code documentation
+            str: Path to the log file the code documentation was appended to
         """
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        doc_path = self.docs_path / 'code' / f'code_{timestamp}.yaml'
+        date = datetime.datetime.now().strftime('%Y%m%d')
+        doc_path = self.docs_path / 'code' / f'code_{date}.jsonl'
         
         documentation = {
             'timestamp': datetime.datetime.now().isoformat(),
@@ -65,8 +64,7 @@ class DocumentationManager:
             'analysis': self._analyze_code(code)
         }
         
-        with open(doc_path, 'w') as f:
-            yaml.dump(documentation, f)
+        append_json_line(doc_path, documentation)
         
         return str(doc_path)
     
@@ -77,10 +75,10 @@ class DocumentationManager:
             deployment_data (Dict[str, Any]): Data about the deployment
             
         Returns:
-            str: Path to the deployment documentation
+            str: Path to the log file the deployment documentation was appended to
         """
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        doc_path = self.docs_path / 'sessions' / f'deployment_{timestamp}.yaml'
+        date = datetime.datetime.now().strftime('%Y%m%d')
+        doc_path = self.docs_path / 'sessions' / f'deployments_{date}.jsonl'
         
         documentation = {
             'timestamp': datetime.datetime.now().isoformat(),
@@ -93,8 +91,7 @@ class DocumentationManager:
             'notes': deployment_data.get('notes', '')
         }
         
-        with open(doc_path, 'w') as f:
-            yaml.dump(documentation, f)
+        append_json_line(doc_path, documentation)
         
         return str(doc_path)
 
@@ -1,10 +1,20 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import networkx as nx
 from pathlib import Path
 import yaml
 import datetime
 
+from ..utils.helpers import dump_json, load_json
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 class KnowledgeLearner:
+    # Parsed knowledge files, reused while their modification time is unchanged
+    _knowledge_cache: Dict[Path, Tuple[int, Any]] = {}
+    
     def __init__(self, knowledge_base_path: str):
         """Initialize the Knowledge Learner.
         
@@ -19,9 +29,26 @@ class KnowledgeLearner:
         """Load existing knowledge from storage."""
         knowledge_path = self.knowledge_base_path / 'knowledge_graph.yaml'
         if knowledge_path.exists():
-            with open(knowledge_path, 'r') as f:
-                data = yaml.safe_load(f)
-                self._reconstruct_graph(data)
+            self._reconstruct_graph(self._read_knowledge(knowledge_path))
+    
+    @classmethod
+    def _read_knowledge(cls, knowledge_path: Path) -> Any:
+        """Read stored knowledge, skipping the parse if the file is unchanged."""
+        mtime = knowledge_path.stat().st_mtime_ns
+        cached = cls._knowledge_cache.get(knowledge_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with open(knowledge_path, 'r') as f:
+            content = f.read()
+        try:
+            data = load_json(content)
+        except ValueError:
+            # Knowledge saved in the older YAML format
+            data = yaml.load(content, Loader=SafeLoader)
+        
+        cls._knowledge_cache[knowledge_path] = (mtime, data)
+        return data
     
     def learn_from_session(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Learn from a generation session.
@@ -90,5 +117,6 @@ class KnowledgeLearner:
         """Save current knowledge to storage."""
         knowledge_path = self.knowledge_base_path / 'knowledge_graph.yaml'
         data = nx.node_link_data(self.knowledge_graph)
-        with open(knowledge_path, 'w') as f:
-            yaml.dump(data, f)
+        # JSON is a subset of YAML, so the file stays readable as before
+        with open(knowledge_path, 'wb') as f:
+            f.write(dump_json(data))
@@ -1,11 +1,23 @@
 from typing import Dict, Any, List
 import ast
+import json
 import os
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=256)
 def analyze_code_structure(code: str) -> Dict[str, Any]:
     """Analyze code structure using AST.
     
+    Results are cached per source string and shared between callers, so
+    they should be treated as read-only.
+    
     Args:
         code (str): Source code to analyze
         
@@ -14,19 +26,54 @@ def analyze_code_structure(code: str) -> Dict[str, Any]:
     """
     try:
         tree = ast.parse(code)
-        return {
-            'imports': _extract_imports(tree),
-            'functions': _extract_functions(tree),
-            'classes': _extract_classes(tree),
-            'complexity': _calculate_complexity(tree)
-        }
     except SyntaxError:
         return {}
+    return _collect_structure(tree)
+
+def _expression_source(node: ast.expr) -> str:
+    """Render an expression as source, with a fast path for dotted names."""
+    parts = []
+    current = node
+    while isinstance(current, ast.Attribute):
+        parts.append(current.attr)
+        current = current.value
+    if isinstance(current, ast.Name):
+        parts.append(current.id)
+        return '.'.join(reversed(parts))
+    # Calls, subscripts and other expressions need the full unparser
+    return ast.unparse(node)
 
-def _extract_imports(tree: ast.AST) -> List[str]:
-    """Extract import statements from AST."""
-    imports = []
-    for node in ast.walk(tree):
+# Node types that each add one decision point to cyclomatic complexity
+_BRANCH_NODES = (ast.If, ast.While, ast.For, ast.ExceptHandler,
+                 ast.With, ast.Assert, ast.Raise)
+
+def _collect_structure(tree: ast.AST) -> Dict[str, Any]:
+    """Extract imports, functions, classes and complexity in one AST pass.
+    
+    Nodes are visited breadth-first, in the same order as ast.walk. Each
+    function and class records the complexity of its own subtree, and
+    class methods include functions nested anywhere inside the class.
+    """
+    imports: List[str] = []
+    functions: List[Dict[str, Any]] = []
+    classes: List[Dict[str, Any]] = []
+    parents: List[int] = []
+    weights: List[int] = []
+    scopes = []
+    
+    todo = deque([(tree, -1, ())])
+    while todo:
+        node, parent, enclosing_classes = todo.popleft()
+        index = len(parents)
+        parents.append(parent)
+        
+        if isinstance(node, _BRANCH_NODES):
+            weights.append(1)
+        elif isinstance(node, ast.BoolOp):
+            weights.append(len(node.values) - 1)
+        else:
+            weights.append(0)
+        
         if isinstance(node, ast.Import):
             for name in node.names:
                 imports.append(name.name)
@@ -34,48 +81,51 @@ def _extract_imports(tree: ast.AST) -> List[str]:
             module = node.module or ''
             for name in node.names:
                 imports.append(f'{module}.{name.name}')
-    return imports
-
-def _extract_functions(tree: ast.AST) -> List[Dict[str, Any]]:
-    """Extract function definitions from AST."""
-    functions = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            functions.append({
+        elif isinstance(node, ast.FunctionDef):
+            function = {
                 'name': node.name,
                 'args': [arg.arg for arg in node.args.args],
-                'decorators': [ast.unparse(d) for d in node.decorator_list],
-                'complexity': _calculate_complexity(node)
-            })
-    return functions
-
-def _extract_classes(tree: ast.AST) -> List[Dict[str, Any]]:
-    """Extract class definitions from AST."""
-    classes = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            classes.append({
+                'decorators': [_expression_source(d) for d in node.decorator_list],
+                'complexity': 1
+            }
+            functions.append(function)
+            for cls in enclosing_classes:
+                cls['methods'].append(function)
+            scopes.append((index, function))
+        elif isinstance(node, ast.ClassDef):
+            cls = {
                 'name': node.name,
-                'bases': [ast.unparse(base) for base in node.bases],
-                'methods': _extract_functions(node),
-                'complexity': _calculate_complexity(node)
-            })
-    return classes
-
-def _calculate_complexity(node: ast.AST) -> int:
-    """Calculate cyclomatic complexity of AST node."""
-    complexity = 1
-    for child in ast.walk(node):
-        if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler,
-                            ast.With, ast.Assert, ast.Raise)):
-            complexity += 1
-        elif isinstance(child, ast.BoolOp):
-            complexity += len(child.values) - 1
-    return complexity
+                'bases': [_expression_source(base) for base in node.bases],
+                'methods': [],
+                'complexity': 1
+            }
+            classes.append(cls)
+            enclosing_classes = enclosing_classes + (cls,)
+            scopes.append((index, cls))
+        
+        for child in ast.iter_child_nodes(node):
+            todo.append((child, index, enclosing_classes))
+    
+    # Children are always visited after their parent, so a reverse sweep
+    # folds each node's weight into its ancestors' subtree totals
+    for index in range(len(parents) - 1, 0, -1):
+        weights[parents[index]] += weights[index]
+    for index, scope in scopes:
+        scope['complexity'] = 1 + weights[index]
+    
+    return {
+        'imports': imports,
+        'functions': functions,
+        'classes': classes,
+        'complexity': 1 + weights[0]
+    }
 
 def safe_write_file(path: str, content: str) -> bool:
     """Safely write content to file.
     
+    The content is written to a temporary file that then replaces the
+    target, so readers never see a partially written file.
+    
     Args:
         path (str): File path
         content (str): Content to write
@@ -83,15 +133,77 @@ def safe_write_file(path: str, content: str) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
+    tmp_path = None
     try:
         path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w') as f:
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            f = open(tmp_path, 'w')
+        except FileNotFoundError:
+            # Only create the parent directories when they are missing
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(tmp_path, 'w')
+        with f:
             f.write(content)
+        os.replace(tmp_path, path)
         return True
     except Exception:
+        # Don't leave a partially written temporary file behind
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
         return False
 
+def dump_json(data: Any) -> bytes:
+    """Serialize data to UTF-8 encoded JSON, using orjson when available.
+    
+    Args:
+        data (Any): JSON-serializable data; other values are stored as strings
+        
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=str).encode('utf-8')
+
+def load_json(content: str) -> Any:
+    """Parse a JSON document, using orjson when available.
+    
+    Args:
+        content (str): JSON document
+        
+    Returns:
+        Any: Parsed data
+        
+    Raises:
+        ValueError: If the content is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def append_json_line(path: str, record: Dict[str, Any]) -> None:
+    """Append a record as one JSON line to a JSONL log file.
+    
+    Args:
+        path (str): JSONL file path
+        record (Dict[str, Any]): JSON-serializable record; other values are stored as strings
+    """
+    append_json_lines(path, [record])
+
+def append_json_lines(path: str, records: List[Dict[str, Any]]) -> None:
+    """Append records as JSON lines to a JSONL log file in a single write.
+    
+    Args:
+        path (str): JSONL file path
+        records (List[Dict[str, Any]]): JSON-serializable records; other values are stored as strings
+    """
+    with open(path, 'ab') as f:
+        f.write(b''.join(dump_json(record) + b'\n' for record in records))
+
 def load_file_safely(path: str) -> str:
     """Safely load file content.
     
@@ -1,23 +1,58 @@
-from knowledge_framework import KnowledgeFramework
 from pathlib import Path
 import streamlit as st
-import yaml
 import datetime
+import atexit
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+
+logger = logging.getLogger(__name__)
+
+# Single background worker so session logging stays off the UI thread while
+# writes remain ordered. concurrent.futures joins it at interpreter exit,
+# before the atexit flush of any still-buffered sessions.
+_log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="knowledge-log")
+
+def _report_log_failure(future: Future):
+    """Log the error of a background logging task, which nothing else awaits."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Failed to log calculation session", exc_info=exc)
 
 class CalculatorKnowledge:
     def __init__(self):
         """Initialize the Calculator Knowledge system."""
         self.knowledge_base_path = Path("knowledge_base")
-        self.framework = KnowledgeFramework(str(self.knowledge_base_path))
+        # Bumped whenever buffered sessions are written, so extracted
+        # knowledge is only recomputed once there is new data
+        self._knowledge_version = 0
+        self._cached_knowledge = None
+        # Logged sessions are buffered and written in batches
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._flush_every = 16
+        atexit.register(self.flush)
         self._initialize()
     
     def _initialize(self):
         """Initialize knowledge base structure."""
         self.knowledge_base_path.mkdir(exist_ok=True)
+    
+    @cached_property
+    def framework(self):
+        """Knowledge framework, created and imported on first use."""
+        from knowledge_framework import KnowledgeFramework
+        return KnowledgeFramework(str(self.knowledge_base_path))
         
     def log_calculation(self, inputs: dict, result: dict):
         """Log a calculation session.
         
+        Sessions are buffered and written once enough have accumulated, or
+        when the process exits.
+        
         Args:
             inputs (dict): Calculator inputs
             result (dict): Calculation results
@@ -29,7 +64,51 @@ class CalculatorKnowledge:
             'type': 'calculation'
         }
         
-        self.framework.document_session(session_data)
+        with self._pending_lock:
+            self._pending.append(session_data)
+            if len(self._pending) < self._flush_every:
+                return
+        self.flush()
+    
+    def flush(self):
+        """Write buffered calculation sessions to the knowledge base.
+        
+        If the write fails the sessions are put back in the buffer, ahead of
+        any logged meanwhile, so they are retried on the next flush.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            self.framework.document_sessions(pending)
+        except Exception:
+            with self._pending_lock:
+                self._pending[:0] = pending
+            logger.exception("Failed to write %d buffered calculation sessions", len(pending))
+            return
+        self._knowledge_version += 1
+    
+    def log_calculation_async(self, inputs: dict, result: dict) -> Future:
+        """Log a calculation session on the background logging worker.
+        
+        Args:
+            inputs (dict): Calculator inputs
+            result (dict): Calculation results
+            
+        Returns:
+            Future: Completes once the session has been logged
+        """
+        future = _log_executor.submit(self.log_calculation, inputs, result)
+        future.add_done_callback(_report_log_failure)
+        return future
+    
+    def _extract_knowledge(self) -> dict:
+        """Extract knowledge, reusing the last result until new sessions are written."""
+        version = self._knowledge_version
+        if self._cached_knowledge is None or self._cached_knowledge[0] != version:
+            self._cached_knowledge = (version, self.framework.extract_knowledge())
+        return self._cached_knowledge[1]
     
     def get_insights(self) -> list:
         """Get insights from accumulated calculations.
@@ -37,16 +116,19 @@ class CalculatorKnowledge:
         Returns:
             list: List of insights
         """
-        knowledge = self.framework.extract_knowledge()
+        knowledge = self._extract_knowledge()
         return knowledge.get('recommendations', [])
     
     def update_learning(self):
         """Update learning based on accumulated knowledge."""
-        knowledge = self.framework.extract_knowledge()
+        knowledge = self._extract_knowledge()
         self.framework.refine_strategy(knowledge)
 
+@st.cache_resource
 def initialize_knowledge_system():
-    """Initialize or get the knowledge system."""
-    if 'knowledge_system' not in st.session_state:
-        st.session_state.knowledge_system = CalculatorKnowledge()
-    return st.session_state.knowledge_system
+    """Initialize or get the knowledge system.
+
+    Cached as a Streamlit resource so the framework is built once per process
+    instead of on every script rerun.
+    """
+    return CalculatorKnowledge()
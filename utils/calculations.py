@@ -0,0 +1,52 @@
+from typing import Tuple
+import numpy as np
+
+WASTAGE_FACTOR = 1.15
+
+def _sealant_quantities(width_cm, depth_cm, length_cm, allow_wastage: bool,
+                        package_size_ml: float, volume_factor: float):
+    """Shared arithmetic for compute_sealant and compute_sealant_batch.
+
+    Works on floats and NumPy arrays alike; full_packages is left as a
+    float (array) for the caller to convert.
+    """
+    base_volume = (width_cm * depth_cm * length_cm) / 1000 * volume_factor
+    volume = base_volume * WASTAGE_FACTOR if allow_wastage else base_volume
+    volume_ml = volume * 1000
+    packages_needed = volume_ml / package_size_ml
+    full_packages, partial_package = divmod(packages_needed, 1.0)
+    return base_volume, volume, volume_ml, packages_needed, full_packages, partial_package
+
+def compute_sealant(width_cm: float, depth_cm: float, length_cm: float,
+                    allow_wastage: bool, package_size_ml: float,
+                    volume_factor: float = 1.0) -> Tuple[float, float, float, float, int, float]:
+    """Calculate sealant volume and package usage.
+
+    volume_factor scales the rectangular joint volume for the profile shape,
+    e.g. 0.5 for a triangular V-joint (see ProfileSpec.volume_factor).
+
+    Returns:
+        Tuple: (base_volume_l, final_volume_l, volume_ml, packages_needed,
+        full_packages, partial_package)
+    """
+    (base_volume, volume, volume_ml, packages_needed,
+     full_packages, partial_package) = _sealant_quantities(
+        width_cm, depth_cm, length_cm, allow_wastage, package_size_ml, volume_factor)
+    return base_volume, volume, volume_ml, packages_needed, int(full_packages), partial_package
+
+def compute_sealant_batch(width_cm, depth_cm, length_cm,
+                          allow_wastage: bool, package_size_ml: float,
+                          volume_factor: float = 1.0) -> Tuple[np.ndarray, ...]:
+    """Calculate sealant volume and package usage for arrays of joint dimensions.
+
+    Dimension arguments may be scalars or array-likes that broadcast together,
+    e.g. for sensitivity tables over a range of widths and depths.
+
+    Returns:
+        Tuple[np.ndarray, ...]: Arrays in the same order as compute_sealant
+    """
+    (base_volume, volume, volume_ml, packages_needed,
+     full_packages, partial_package) = _sealant_quantities(
+        np.asarray(width_cm, dtype=float), np.asarray(depth_cm, dtype=float),
+        np.asarray(length_cm, dtype=float), allow_wastage, package_size_ml, volume_factor)
+    return base_volume, volume, volume_ml, packages_needed, full_packages.astype(int), partial_package
@@ -1,9 +1,12 @@
 from dataclasses import dataclass
-from typing import Dict, Any
+import operator
+from functools import lru_cache
+from typing import Dict, Any, NamedTuple, Tuple
 from pathlib import Path
-from knowledge_framework.documentation.doc_manager import DocumentationManager
+from types import MappingProxyType
+import numpy as np
 
-@dataclass
+@dataclass(frozen=True)
 class JointProfile:
     name: str
     typical_width: float
@@ -16,11 +19,17 @@ class JointProfile:
     @staticmethod
     def get_specifications() -> str:
         """Get detailed joint specifications from documentation."""
-        doc_manager = DocumentationManager(Path(__file__).parent.parent)
-        return doc_manager.get_joint_specifications()
+        return _documentation_manager().get_joint_specifications()
 
-# Define common joint profiles
-JOINT_PROFILES = {
+@lru_cache(maxsize=1)
+def _documentation_manager():
+    """Create the project documentation manager on first use."""
+    from knowledge_framework.documentation.doc_manager import DocumentationManager
+    return DocumentationManager(Path(__file__).parent.parent)
+
+# Define common joint profiles. The mapping is read-only since lookups
+# from it are cached.
+JOINT_PROFILES = MappingProxyType({
     "Square Joint": JointProfile(
         name="Square Joint",
         typical_width=12.0,
@@ -66,44 +75,79 @@ JOINT_PROFILES = {
         formula="Volume (L) = Width (cm) × Depth (cm) × Length (m) × 100 ÷ 1000",
         notes="Suitable for expansion joints. Requires special tooling for U-shape formation."
     )
-}
+})
 
+# Joint profile choices offered in the UI, including custom dimensions
+PROFILE_OPTIONS = (*JOINT_PROFILES, "Custom")
+
+@lru_cache(maxsize=16)
 def get_joint_profile(profile_name: str) -> JointProfile:
     """Get joint profile by name."""
     return JOINT_PROFILES.get(profile_name, JOINT_PROFILES["Square Joint"])
 
+# Unit conversion factors. Conversions to a smaller unit multiply and
+# conversions to a larger unit divide, so that whole-millimetre limits such
+# as 12mm map to exactly 1.2cm.
+CM_TO_MM = 10.0
+M_TO_CM = 100.0
+M_TO_MM = M_TO_CM * CM_TO_MM
+
+# Operation and factor for each supported (from_unit, to_unit) pair
+UNIT_CONVERSIONS = {
+    ("mm", "cm"): (operator.truediv, CM_TO_MM),
+    ("cm", "mm"): (operator.mul, CM_TO_MM),
+    ("m", "cm"): (operator.mul, M_TO_CM),
+    ("cm", "m"): (operator.truediv, M_TO_CM),
+    ("m", "mm"): (operator.mul, M_TO_MM),
+    ("mm", "m"): (operator.truediv, M_TO_MM),
+}
+
 class UnitConverter:
     @staticmethod
     def mm_to_cm(value: float) -> float:
-        return value / 10
+        return value / CM_TO_MM
 
     @staticmethod
     def cm_to_mm(value: float) -> float:
-        return value * 10
+        return value * CM_TO_MM
 
     @staticmethod
     def m_to_cm(value: float) -> float:
-        return value * 100
+        return value * M_TO_CM
 
     @staticmethod
     def cm_to_m(value: float) -> float:
-        return value / 100
+        return value / M_TO_CM
 
     @staticmethod
     def convert(value: float, from_unit: str, to_unit: str) -> float:
         """Convert between different units."""
-        # Convert to cm first
-        if from_unit == "mm":
-            value = UnitConverter.mm_to_cm(value)
-        elif from_unit == "m":
-            value = UnitConverter.m_to_cm(value)
-        
-        # Convert from cm to target unit
-        if to_unit == "mm":
-            return UnitConverter.cm_to_mm(value)
-        elif to_unit == "m":
-            return UnitConverter.cm_to_m(value)
-        return value  # cm
+        conversion = UNIT_CONVERSIONS.get((from_unit, to_unit))
+        if conversion is None:
+            return value  # Same or unrecognised unit
+        op, factor = conversion
+        return op(value, factor)
+
+class ProfileSpec(NamedTuple):
+    """Validation ratios and limits for a joint profile."""
+    width_to_depth_ratio: float
+    min_width_mm: float
+    max_width_mm: float
+    min_depth_mm: float
+    max_depth_mm: float
+    ratio_tolerance: float = 0.5
+    volume_factor: float = 1.0
+    curved_profile: bool = False
+
+# Columns of the flag array returned by JointValidator.validate_dimensions_batch
+VALIDATION_FLAGS = (
+    "width_below_min",
+    "width_above_max",
+    "depth_below_min",
+    "depth_above_max",
+    "too_shallow",
+    "too_deep",
+)
 
 class JointValidator:
     # Common limits
@@ -113,63 +157,65 @@ class JointValidator:
     MAX_WIDTH_MM = 24
 
     # Profile-specific ratios and limits
-    PROFILE_SPECS = {
-        "Square Joint": {
-            "width_to_depth_ratio": 2.0,  # Standard 2:1 ratio
-            "min_width_mm": 6,
-            "max_width_mm": 24,
-            "min_depth_mm": 6,
-            "max_depth_mm": 12,
-            "ratio_tolerance": 0.2  # 20% tolerance
-        },
-        "Deep Joint": {
-            "width_to_depth_ratio": 1.0,  # 1:1 ratio for deep joints
-            "min_width_mm": 6,
-            "max_width_mm": 12,
-            "min_depth_mm": 6,
-            "max_depth_mm": 12,
-            "ratio_tolerance": 0.2
-        },
-        "Wide Joint": {
-            "width_to_depth_ratio": 2.0,  # 2:1 ratio (width:depth)
-            "min_width_mm": 25,
-            "max_width_mm": 50,
-            "min_depth_mm": 6,
-            "max_depth_mm": 12,
-            "ratio_tolerance": 0.3  # More tolerance for wide joints
-        },
-        "V-Joint": {
-            "width_to_depth_ratio": 1.5,  # 1.5:1 ratio for angular joints
-            "min_width_mm": 6,
-            "max_width_mm": 20,
-            "min_depth_mm": 6,
-            "max_depth_mm": 12,
-            "ratio_tolerance": 0.25,
-            "volume_factor": 0.5  # Half volume due to triangular profile
-        },
-        "U-Joint": {
-            "width_to_depth_ratio": 1.5,  # 1.5:1 ratio for curved joints
-            "min_width_mm": 8,
-            "max_width_mm": 24,
-            "min_depth_mm": 8,
-            "max_depth_mm": 15,
-            "ratio_tolerance": 0.25,
-            "curved_profile": True  # Indicates special volume consideration
-        }
-    }
+    PROFILE_SPECS = MappingProxyType({
+        "Square Joint": ProfileSpec(
+            width_to_depth_ratio=2.0,  # Standard 2:1 ratio
+            min_width_mm=6,
+            max_width_mm=24,
+            min_depth_mm=6,
+            max_depth_mm=12,
+            ratio_tolerance=0.2  # 20% tolerance
+        ),
+        "Deep Joint": ProfileSpec(
+            width_to_depth_ratio=1.0,  # 1:1 ratio for deep joints
+            min_width_mm=6,
+            max_width_mm=12,
+            min_depth_mm=6,
+            max_depth_mm=12,
+            ratio_tolerance=0.2
+        ),
+        "Wide Joint": ProfileSpec(
+            width_to_depth_ratio=2.0,  # 2:1 ratio (width:depth)
+            min_width_mm=25,
+            max_width_mm=50,
+            min_depth_mm=6,
+            max_depth_mm=12,
+            ratio_tolerance=0.3  # More tolerance for wide joints
+        ),
+        "V-Joint": ProfileSpec(
+            width_to_depth_ratio=1.5,  # 1.5:1 ratio for angular joints
+            min_width_mm=6,
+            max_width_mm=20,
+            min_depth_mm=6,
+            max_depth_mm=12,
+            ratio_tolerance=0.25,
+            volume_factor=0.5  # Half volume due to triangular profile
+        ),
+        "U-Joint": ProfileSpec(
+            width_to_depth_ratio=1.5,  # 1.5:1 ratio for curved joints
+            min_width_mm=8,
+            max_width_mm=24,
+            min_depth_mm=8,
+            max_depth_mm=15,
+            ratio_tolerance=0.25,
+            curved_profile=True  # Indicates special volume consideration
+        )
+    })
     
     @staticmethod
-    def get_profile_specs(profile_name: str) -> dict:
+    @lru_cache(maxsize=16)
+    def get_profile_specs(profile_name: str) -> ProfileSpec:
         """Get specifications for a specific joint profile."""
         return JointValidator.PROFILE_SPECS.get(profile_name, JointValidator.PROFILE_SPECS["Square Joint"])
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_recommended_depth(width_mm: float, profile_name: str) -> float:
         """Calculate recommended depth based on width and profile type."""
         specs = JointValidator.get_profile_specs(profile_name)
-        recommended = width_mm / specs["width_to_depth_ratio"]
-        return max(specs["min_depth_mm"], 
-                  min(recommended, specs["max_depth_mm"]))
+        recommended = width_mm / specs.width_to_depth_ratio
+        return max(specs.min_depth_mm, 
+                  min(recommended, specs.max_depth_mm))
     
     @staticmethod
     def get_recommended_dimensions(width_mm: float = None, depth_mm: float = None, profile_name: str = "Square Joint") -> dict:
@@ -183,9 +229,9 @@ class JointValidator:
         
         if width_mm is not None:
             # Calculate depth based on width
-            recommended_depth = width_mm / specs["width_to_depth_ratio"]
-            recommended_depth = max(specs["min_depth_mm"], 
-                                 min(recommended_depth, specs["max_depth_mm"]))
+            recommended_depth = width_mm / specs.width_to_depth_ratio
+            recommended_depth = max(specs.min_depth_mm, 
+                                 min(recommended_depth, specs.max_depth_mm))
             result.update({
                 "recommended_depth": recommended_depth,
                 "based_on": "width"
@@ -193,9 +239,9 @@ class JointValidator:
         
         if depth_mm is not None:
             # Calculate width based on depth
-            recommended_width = depth_mm * specs["width_to_depth_ratio"]
-            recommended_width = max(specs["min_width_mm"], 
-                                 min(recommended_width, specs["max_width_mm"]))
+            recommended_width = depth_mm * specs.width_to_depth_ratio
+            recommended_width = max(specs.min_width_mm, 
+                                 min(recommended_width, specs.max_width_mm))
             result.update({
                 "recommended_width": recommended_width,
                 "based_on": "depth"
@@ -203,6 +249,15 @@ class JointValidator:
             
         return result
     
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def get_dimension_limits(profile_name: str, unit: str = "mm") -> Tuple[float, float, float, float]:
+        """Get (min_width, max_width, min_depth, max_depth) for a profile in mm or cm."""
+        specs = JointValidator.get_profile_specs(profile_name)
+        unit_divisor = CM_TO_MM if unit == "cm" else 1.0
+        return (specs.min_width_mm / unit_divisor, specs.max_width_mm / unit_divisor,
+                specs.min_depth_mm / unit_divisor, specs.max_depth_mm / unit_divisor)
+    
     @staticmethod
     def validate_dimensions(width_mm: float, depth_mm: float, profile_name: str, unit: str = "mm") -> dict:
         """Validate joint dimensions based on profile type."""
@@ -210,20 +265,11 @@ class JointValidator:
         warnings = []
         recommendations = []
         
-        # Convert min/max values if unit is cm
-        unit_converter = lambda x: x/10 if unit == "cm" else x
-        
-        min_width = unit_converter(specs["min_width_mm"])
-        max_width = unit_converter(specs["max_width_mm"])
-        min_depth = unit_converter(specs["min_depth_mm"])
-        max_depth = unit_converter(specs["max_depth_mm"])
-        
-        # Convert input values for comparison
-        width = width_mm
-        depth = depth_mm
-        if unit == "cm":
-            width = UnitConverter.mm_to_cm(width_mm)
-            depth = UnitConverter.mm_to_cm(depth_mm)
+        # Convert min/max and input values to the display unit
+        min_width, max_width, min_depth, max_depth = JointValidator.get_dimension_limits(profile_name, unit)
+        unit_divisor = CM_TO_MM if unit == "cm" else 1.0
+        width = width_mm / unit_divisor
+        depth = depth_mm / unit_divisor
 
         if width < min_width:
             warnings.append(f"Width ({width:.1f}{unit}) is below minimum recommended width ({min_width:.1f}{unit}) for {profile_name}")
@@ -237,8 +283,8 @@ class JointValidator:
 
         # Check width-to-depth ratio
         actual_ratio = width / depth if depth != 0 else float('inf')
-        target_ratio = specs["width_to_depth_ratio"]
-        tolerance = specs.get("ratio_tolerance", 0.5)
+        target_ratio = specs.width_to_depth_ratio
+        tolerance = specs.ratio_tolerance
         
         # For Wide Joint, we mainly care if depth is greater than width
         if profile_name == "Wide Joint":
@@ -254,11 +300,52 @@ class JointValidator:
 
         # Add recommendation for ideal ratio
         if width > 0:
-            ideal_depth = width / specs["width_to_depth_ratio"]
-            recommendations.append(f"For {profile_name}, recommended depth for {width:.1f}{unit} width is {ideal_depth:.1f}{unit} ({specs['width_to_depth_ratio']:.1f}:1 width-to-depth ratio)")
+            ideal_depth = width / specs.width_to_depth_ratio
+            recommendations.append(f"For {profile_name}, recommended depth for {width:.1f}{unit} width is {ideal_depth:.1f}{unit} ({specs.width_to_depth_ratio:.1f}:1 width-to-depth ratio)")
 
         return {
             "is_valid": len(warnings) == 0,
             "warnings": warnings,
             "recommendations": recommendations
         }
+    
+    @staticmethod
+    def validate_dimensions_batch(widths_mm, depths_mm, profile_name: str) -> np.ndarray:
+        """Validate many joint dimensions for a profile at once.
+        
+        Applies the same checks as validate_dimensions without building the
+        messages, e.g. for what-if tables over ranges of widths and depths.
+        
+        Args:
+            widths_mm: Joint widths in mm, scalar or array-like
+            depths_mm: Joint depths in mm, broadcastable against widths_mm
+            profile_name (str): Joint profile name
+            
+        Returns:
+            np.ndarray: Boolean flags with a trailing axis ordered as
+            VALIDATION_FLAGS; a row is valid when none of its flags are set
+        """
+        specs = JointValidator.get_profile_specs(profile_name)
+        width, depth = np.broadcast_arrays(np.asarray(widths_mm, dtype=float),
+                                           np.asarray(depths_mm, dtype=float))
+        
+        if profile_name == "Wide Joint":
+            too_shallow = np.zeros(width.shape, dtype=bool)
+            too_deep = depth > width
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                actual_ratio = np.where(depth != 0, width / np.where(depth != 0, depth, 1.0), np.inf)
+            target_ratio = specs.width_to_depth_ratio
+            tolerance = specs.ratio_tolerance
+            outside = np.abs(actual_ratio - target_ratio) > tolerance
+            too_shallow = outside & (actual_ratio > target_ratio + tolerance)
+            too_deep = outside & ~too_shallow & (actual_ratio < target_ratio - tolerance)
+        
+        return np.stack([
+            width < specs.min_width_mm,
+            width > specs.max_width_mm,
+            depth < specs.min_depth_mm,
+            depth > specs.max_depth_mm,
+            too_shallow,
+            too_deep,
+        ], axis=-1)
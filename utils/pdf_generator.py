@@ -4,33 +4,68 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, IO, Optional, Union
 
-def generate_calculation_summary(data: Dict[str, Any], output_path: str) -> str:
-    """Generate PDF summary of calculations."""
+# Paragraph styles are only read while building, so they are shared by all reports
+SUMMARY_STYLES = getSampleStyleSheet()
+SUMMARY_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=SUMMARY_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30
+)
+
+SUMMARY_NOTES = (
+    "1. Calculations are based on the formula: Volume = Width × Depth × Length ÷ 1000 × profile volume factor "
+    "(0.5 for V-Joints, 1.0 for all other profiles)",
+    "2. A 15% wastage allowance is recommended for most applications",
+    "3. Always check manufacturer guidelines for specific applications",
+    "4. Store sealant in a cool, dry place and check expiration dates"
+)
+
+# Header row and body styling shared by the summary tables
+SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 14),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+def generate_calculation_summary(data: Dict[str, Any],
+                                 output_path: Union[str, IO[bytes]],
+                                 timestamp: Optional[str] = None) -> Union[str, IO[bytes]]:
+    """Generate PDF summary of calculations to a file path or binary file-like object.
+
+    timestamp is the "Generated on" text; reports generated in a batch can
+    share one instead of each formatting the current time.
+    """
     doc = SimpleDocTemplate(output_path, pagesize=letter)
-    styles = getSampleStyleSheet()
+    styles = SUMMARY_STYLES
     elements = []
 
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30
-    )
-    elements.append(Paragraph("Silicone Sealant Calculation Summary", title_style))
+    elements.append(Paragraph("Silicone Sealant Calculation Summary", SUMMARY_TITLE_STYLE))
     elements.append(Spacer(1, 12))
 
     # Date and Time
-    elements.append(Paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M')}", 
-                            styles["Normal"]))
+    if timestamp is None:
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+    elements.append(Paragraph(f"Generated on: {timestamp}", styles["Normal"]))
     elements.append(Spacer(1, 12))
 
     # Input Parameters
     elements.append(Paragraph("Input Parameters:", styles["Heading2"]))
     input_data = [
         ["Parameter", "Value", "Unit"],
+        ["Joint Profile", data['profile'], ""],
+        ["Volume Factor", f"{data['volume_factor']:.2f}", ""],
         ["Joint Width", f"{data['width']:.1f}", "cm"],
         ["Joint Depth", f"{data['depth']:.1f}", "cm"],
         ["Joint Length", f"{data['length']:.1f}", "cm"],
@@ -39,19 +74,7 @@ def generate_calculation_summary(data: Dict[str, Any], output_path: str) -> str:
     ]
     
     t = Table(input_data, colWidths=[2*inch, 1.5*inch, 1*inch])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    t.setStyle(SUMMARY_TABLE_STYLE)
     elements.append(t)
     elements.append(Spacer(1, 20))
 
@@ -66,31 +89,13 @@ def generate_calculation_summary(data: Dict[str, Any], output_path: str) -> str:
     ]
     
     t = Table(results_data, colWidths=[2*inch, 1.5*inch, 1*inch])
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    t.setStyle(SUMMARY_TABLE_STYLE)
     elements.append(t)
     elements.append(Spacer(1, 20))
 
     # Notes
     elements.append(Paragraph("Notes:", styles["Heading2"]))
-    notes = [
-        "1. Calculations are based on the standard formula: Volume = Width × Depth × Length ÷ 1000",
-        "2. A 15% wastage allowance is recommended for most applications",
-        "3. Always check manufacturer guidelines for specific applications",
-        "4. Store sealant in a cool, dry place and check expiration dates"
-    ]
-    for note in notes:
+    for note in SUMMARY_NOTES:
         elements.append(Paragraph(note, styles["Normal"]))
         elements.append(Spacer(1, 6))
 
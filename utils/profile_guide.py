@@ -0,0 +1,104 @@
+from typing import Dict, Tuple
+from utils.joint_profiles import PROFILE_OPTIONS, JointValidator
+
+# Profile-specific guide content
+PROFILE_DESCRIPTIONS = {
+    "Square Joint": "Standard profile with width twice the depth (2:1 ratio), providing optimal balance between movement capability and material usage.",
+    "Deep Joint": "Deep profile with equal width and depth (1:1 ratio), ideal for joints with limited width but requiring good depth.",
+    "Wide Joint": "Wide profile with width twice the depth (2:1 ratio), suitable for larger gaps requiring multiple passes.",
+    "V-Joint": "V-shaped profile for corner applications (1.5:1 ratio), uses half the volume of a square joint due to triangular profile.",
+    "U-Joint": "U-shaped profile with enhanced movement capability (1.5:1 ratio), requires special tooling for proper formation."
+}
+
+PROFILE_APPLICATIONS = {
+    "Square Joint": "Most common profile type, ideal for general sealing applications",
+    "Deep Joint": "Requires backing rod, ideal for joints with limited width but requiring good depth",
+    "Wide Joint": "Suitable for larger gaps, may require multiple application passes",
+    "V-Joint": "Ideal for corner applications, good for joints with angular movement",
+    "U-Joint": "Suitable for expansion joints, excellent for accommodating multi-directional movement"
+}
+
+PROFILE_INSTALLATION_NOTES = {
+    "Square Joint": "Use backing rod if depth exceeds 10mm",
+    "Deep Joint": "Always use backing rod",
+    "Wide Joint": "Depth should not exceed half the width for proper adhesion",
+    "V-Joint": "Tooling is critical for proper shape formation",
+    "U-Joint": "Requires special tooling for U-shape formation"
+}
+
+PROFILE_VOLUME_NOTES = {
+    "Square Joint": "Standard volume calculation",
+    "Deep Joint": "Standard volume calculation",
+    "Wide Joint": "Consider multiple passes for large gaps",
+    "V-Joint": "Volume is approximately half of a square joint due to triangular profile",
+    "U-Joint": "Additional material needed for curved profile"
+}
+
+PROFILE_RATIO_EXAMPLES = {
+    "Square Joint": """
+    | Correct Ratio | Incorrect Ratio |
+    |---|---|
+    | 12mm wide x 6mm deep | 10mm wide x 10mm deep |
+    | 20mm wide x 10mm deep | 30mm wide x 10mm deep |
+    """,
+    "Deep Joint": """
+    | Correct Ratio | Incorrect Ratio |
+    |---|---|
+    | 20mm wide x 20mm deep | 10mm wide x 20mm deep |
+    | 15mm wide x 18mm deep | 30mm wide x 40mm deep |
+    """,
+    "Wide Joint": """
+    | Correct Ratio | Incorrect Ratio |
+    |---|---|
+    | 30mm wide x 12mm deep | 30mm wide x 20mm deep |
+    | 40mm wide x 12mm deep | 50mm wide x 10mm deep |
+    """,
+    "V-Joint": """
+    | Correct Ratio | Incorrect Ratio |
+    |---|---|
+    | 15mm wide x 10mm deep | 10mm wide x 10mm deep |
+    | 20mm wide x 12mm deep | 30mm wide x 10mm deep |
+    """,
+    "U-Joint": "*Due to the complexity of U-shaped joints, specific dimension recommendations are highly application-specific.*"
+}
+
+DEFAULT_RATIO_EXAMPLES = "*Custom profile dimensions should be based on specific project requirements.*"
+
+def render_profile_specs(profile_name: str) -> Tuple[str, str]:
+    """Build the Joint Specifications Guide markdown for a profile.
+
+    Returns:
+        Tuple[str, str]: (main_md, ratio_table_md) markdown strings
+    """
+    profile_specs = JointValidator.get_profile_specs(profile_name)
+    
+    main_md = f"""
+    #### Profile Description
+    {PROFILE_DESCRIPTIONS.get(profile_name, "Custom profile for specific requirements.")}
+    
+    #### Joint Dimension Guidelines
+    - **Width Range**: {profile_specs.min_width_mm}mm - {profile_specs.max_width_mm}mm
+    - **Depth Range**: {profile_specs.min_depth_mm}mm - {profile_specs.max_depth_mm}mm
+    - **Ideal Ratio**: Width:Depth = {profile_specs.width_to_depth_ratio}:1
+    - **Tolerance**: ±{int(profile_specs.ratio_tolerance*100)}% from ideal ratio
+    
+    #### Profile-Specific Considerations
+    1. **Typical Applications**:
+       - {PROFILE_APPLICATIONS.get(profile_name, "Custom applications")}
+       
+    2. **Installation Notes**:
+       - {PROFILE_INSTALLATION_NOTES.get(profile_name, "Follow manufacturer guidelines")}
+
+    3. **Volume Considerations**:
+       - {PROFILE_VOLUME_NOTES.get(profile_name, "Calculate based on specific requirements")}
+    
+    #### Joint Ratio Examples
+    """
+    ratio_md = PROFILE_RATIO_EXAMPLES.get(profile_name, DEFAULT_RATIO_EXAMPLES)
+
+    return main_md, ratio_md
+
+# Guide markdown for every selectable profile, rendered once at import
+PROFILE_SPECS_MARKDOWN: Dict[str, Tuple[str, str]] = {
+    name: render_profile_specs(name) for name in PROFILE_OPTIONS
+}